@@ -32,6 +32,13 @@ LOCAL_JM_INTERVAL = 2
 # Task Manager Interval
 TM_INTERVAL = 1
 
+# Initial interval for orchestrator launch status checks
+ORC_LAUNCH_INTERVAL = 0.25
+
+# Maximum number of threads for concurrent job launches and
+# entity directory generation
+MAX_WORKER_THREADS = 32
+
 # Statuses that are applied to jobs
 STATUS_RUNNING = "Running"
 STATUS_COMPLETED = "Completed"
@@ -50,5 +57,5 @@ SMARTSIM_STATUS = {
 }
 
 # Status groupings
-TERMINAL_STATUSES = (STATUS_CANCELLED, STATUS_COMPLETED, STATUS_FAILED)
-LIVE_STATUSES = (STATUS_RUNNING, STATUS_PAUSED, STATUS_NEW)
+TERMINAL_STATUSES = frozenset((STATUS_CANCELLED, STATUS_COMPLETED, STATUS_FAILED))
+LIVE_STATUSES = frozenset((STATUS_RUNNING, STATUS_PAUSED, STATUS_NEW))
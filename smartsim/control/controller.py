@@ -28,9 +28,15 @@ import os.path as osp
 import pickle
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from ..config import CONFIG
-from ..constants import STATUS_RUNNING, TERMINAL_STATUSES
+from ..constants import (
+    MAX_WORKER_THREADS,
+    ORC_LAUNCH_INTERVAL,
+    STATUS_RUNNING,
+    TERMINAL_STATUSES,
+)
 from ..database import Orchestrator
 from ..entity import DBNode, EntityList, SmartSimEntity
 from ..error import LauncherError, SmartSimError, SSConfigError, SSUnsupportedError
@@ -44,6 +50,14 @@ logger = get_logger(__name__)
 # job manager lock
 JM_LOCK = threading.RLock()
 
+# supported launchers by name
+_LAUNCHERS = {
+    "slurm": SlurmLauncher,
+    "local": LocalLauncher,
+    "pbs": PBSLauncher,
+    "cobalt": CobaltLauncher,
+}
+
 
 class Controller:
     """The controller module provides an interface between the
@@ -84,35 +98,43 @@ class Controller:
 
     @property
     def orchestrator_active(self):
-        JM_LOCK.acquire()
-        try:
-            if len(self._jobs.db_jobs) > 0:
-                return True
-            return False
-        finally:
-            JM_LOCK.release()
+        """Return True if a database job is being monitored
+
+        Reads the JobManager's published snapshot of database
+        jobs, so the lock is only acquired if it must be rebuilt.
+        A stale result is only possible while a database job is
+        being added or removed.
+
+        :returns: bool
+        """
+        return len(self._jobs.db_snapshot) > 0
 
     def poll(self, interval, verbose):
         """Poll running jobs and receive logging output of job status
 
         :param interval: number of seconds to wait before polling again
         :type interval: int
-        :param verbose: set verbosity
+        :param verbose: set verbosity, only changes in job status are logged
         :type verbose: bool
         """
-        to_monitor = self._jobs.jobs
+        last_logged = {}
+        to_monitor = self._jobs.snapshot
         while len(to_monitor) > 0:
-            time.sleep(interval)
+            # returns early once the last job completes
+            self._jobs.wait_for_update(
+                interval, predicate=lambda: len(self._jobs.snapshot) == 0
+            )
 
-            # acquire lock to avoid "dictionary changed during iteration" error
-            # without having to copy dictionary each time.
+            # the snapshot is replaced, never mutated, by the JobManager
+            # so it can be iterated without holding the lock. Re-read it
+            # each time so that jobs launched while polling are observed.
+            to_monitor = self._jobs.snapshot
             if verbose:
-                JM_LOCK.acquire()
-                try:
-                    for job in to_monitor.values():
+                for job in to_monitor.values():
+                    state = (job.jid, job.status, job.returncode)
+                    if last_logged.get(job.ename) != state:
+                        last_logged[job.ename] = state
                         logger.info(job)
-                finally:
-                    JM_LOCK.release()
 
     def finished(self, entity):
         """Return a boolean indicating wether a job has finished or not
@@ -125,7 +147,9 @@ class Controller:
             if isinstance(entity, Orchestrator):
                 raise TypeError("Finished() does not support Orchestrator instances")
             if isinstance(entity, EntityList):
-                return all([self.finished(ent) for ent in entity.entities])
+                # members are plain entities, skip re-checking their types
+                # and stop at the first unfinished member
+                return all(map(self._jobs.is_finished, entity.entities))
             if not isinstance(entity, SmartSimEntity):
                 raise TypeError(
                     f"Argument was of type {type(entity)} not Model or Ensemble"
@@ -209,10 +233,7 @@ class Controller:
             raise TypeError(f"Argument was of type {type(entity_list)} not EntityList")
         if entity_list.batch:
             return [self.get_entity_status(entity_list)]
-        statuses = []
-        for entity in entity_list.entities:
-            statuses.append(self.get_entity_status(entity))
-        return statuses
+        return self._jobs.get_statuses(entity_list.entities)
 
     def init_launcher(self, launcher):
         """Initialize the controller with a specific type of launcher.
@@ -229,28 +250,15 @@ class Controller:
                                     a supported launcher
         :raises SSConfigError: if no launcher argument is provided.
         """
-        if launcher is not None:
-            launcher = launcher.lower()
-            # Init Slurm Launcher
-            if launcher == "slurm":
-                self._launcher = SlurmLauncher()
-                self._jobs.set_launcher(self._launcher)
-            # Run all ensembles locally
-            elif launcher == "local":
-                self._launcher = LocalLauncher()
-                self._jobs.set_launcher(self._launcher)
-            # Init PBSPro launcher
-            elif launcher == "pbs":
-                self._launcher = PBSLauncher()
-                self._jobs.set_launcher(self._launcher)
-            elif launcher == "cobalt":
-                self._launcher = CobaltLauncher()
-                self._jobs.set_launcher(self._launcher)
-            else:
-                raise SSUnsupportedError("Launcher type not supported: " + launcher)
-        else:
+        if launcher is None:
             raise SSConfigError("Must provide a 'launcher' argument")
 
+        launcher_class = _LAUNCHERS.get(launcher.lower(), None)
+        if launcher_class is None:
+            raise SSUnsupportedError("Launcher type not supported: " + launcher)
+        self._launcher = launcher_class()
+        self._jobs.set_launcher(self._launcher)
+
     def _launch(self, entities, entity_lists, orchestrator):
         """Main launching function of the controller
 
@@ -271,25 +279,54 @@ class Controller:
                 raise SmartSimError(msg)
             self._launch_orchestrator(orchestrator)
 
+        # database address is shared by all entities so only build it once
+        ssdb = ",".join(self._jobs.get_db_host_addresses())
+
+        # split entity lists into batch workloads and, for ensembles run
+        # as seperate job steps, their individual member entities
+        entity_lists = entity_lists or ()
+        batch_elists = [elist for elist in entity_lists if elist.batch]
+        step_entities = [
+            e for elist in entity_lists if not elist.batch for e in elist.entities
+        ]
+        # models themselves cannot be batch steps
+        step_entities.extend(entities or ())
+
         # create all steps prior to launch
-        steps = []
-        if entity_lists:
-            for elist in entity_lists:
-                if elist.batch:
-                    batch_step = self._create_batch_job_step(elist)
-                    steps.append((batch_step, elist))
-                else:
-                    # if ensemble is to be run as seperate job steps, aka not in a batch
-                    job_steps = [(self._create_job_step(e), e) for e in elist.entities]
-                    steps.extend(job_steps)
-        if entities:
-            # models themselves cannot be batch steps
-            job_steps = [(self._create_job_step(e), e) for e in entities]
-            steps.extend(job_steps)
+        steps = [(self._create_batch_job_step(el, ssdb), el) for el in batch_elists]
+        steps.extend((self._create_job_step(e, ssdb), e) for e in step_entities)
 
         # launch steps
-        for job_step in steps:
-            self._launch_step(*job_step)
+        self._launch_steps(steps)
+
+    def _launch_steps(self, steps):
+        """Launch a list of independent job steps
+
+        Submitting to a workload manager is mostly spent waiting
+        on subprocesses so, for WLM launchers, the submissions are
+        made concurrently. If any step fails to launch, steps that
+        have not yet started launching are cancelled. Steps that
+        are already launching are left to finish.
+
+        :param steps: list of (job step, entity) tuples
+        :type steps: list[tuple]
+        :raises SmartSimError: if a launch fails
+        """
+        if isinstance(self._launcher, LocalLauncher) or len(steps) < 2:
+            for job_step in steps:
+                self._launch_step(*job_step)
+            return
+
+        max_workers = min(MAX_WORKER_THREADS, len(steps))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(self._launch_step, *step) for step in steps]
+            try:
+                for future in as_completed(futures):
+                    future.result()
+            except BaseException:
+                for future in futures:
+                    future.cancel()
+                raise
 
     def _launch_orchestrator(self, orchestrator):
         """Launch an Orchestrator instance
@@ -305,7 +342,7 @@ class Controller:
 
         # if the orchestrator was launched as a batch workload
         if orchestrator.batch:
-            orc_batch_step = self._create_batch_job_step(orchestrator)
+            orc_batch_step = self._create_batch_job_step(orchestrator, None)
             self._launch_step(orc_batch_step, orchestrator)
             self._orchestrator_launch_wait(orchestrator)
             try:
@@ -322,17 +359,17 @@ class Controller:
 
         # if orchestrator was run on existing allocation, locally, or in allocation
         else:
-            db_steps = [(self._create_job_step(db), db) for db in orchestrator]
-            for db_step in db_steps:
-                self._launch_step(*db_step)
+            db_steps = [(self._create_job_step(db, None), db) for db in orchestrator]
+            db_step_names = []
+            for db_step, db in db_steps:
+                self._launch_step(db_step, db)
+                db_step_names.append(db_step.name)
 
             # wait for orchestrator to spin up
             self._orchestrator_launch_wait(orchestrator)
             try:
-                db_step_names = [db_step[0].name for db_step in db_steps]
                 nodes = self._launcher.get_step_nodes(db_step_names)
-                for db, node in zip(orchestrator, nodes):
-                    db._host = node[0]
+                orchestrator._assign_hosts(nodes)
 
             # catch if it fails or launcher doesn't support it
             except LauncherError:
@@ -378,11 +415,14 @@ class Controller:
             logger.debug(f"Launching {entity.name}")
             self._jobs.add_job(job_step.name, job_id, entity)
 
-    def _create_batch_job_step(self, entity_list):
+    def _create_batch_job_step(self, entity_list, ssdb):
         """Use launcher to create batch job step
 
         :param entity_list: EntityList to launch as batch
         :type entity_list: EntityList
+        :param ssdb: comma separated database addresses, None
+                     when launching the orchestrator itself
+        :type ssdb: str | None
         :return: job step instance
         :rtype: Step
         """
@@ -392,37 +432,45 @@ class Controller:
         for entity in entity_list.entities:
             # tells step creation not to look for an allocation
             entity.run_settings.in_batch = True
-            step = self._create_job_step(entity)
+            if not isinstance(entity, DBNode):
+                self._prep_entity_client_env(entity, ssdb)
+
+        step_specs = [(e.name, e.path, e.run_settings) for e in entity_list.entities]
+        for step in self._launcher.create_steps(step_specs):
             batch_step.add_to_batch(step)
         return batch_step
 
-    def _create_job_step(self, entity):
+    def _create_job_step(self, entity, ssdb):
         """Create job steps for all entities with the launcher
 
         :param entities: list of all entities to create steps for
         :type entities: list of SmartSimEntities
+        :param ssdb: comma separated database addresses, None
+                     when launching the orchestrator itself
+        :type ssdb: str | None
         :return: list of tuples of (launcher_step, entity)
         :rtype: list of tuples
         """
         # get SSDB, SSIN, SSOUT and add to entity run settings
         if not isinstance(entity, DBNode):
-            self._prep_entity_client_env(entity)
+            self._prep_entity_client_env(entity, ssdb)
 
         step = self._launcher.create_step(entity.name, entity.path, entity.run_settings)
         return step
 
-    def _prep_entity_client_env(self, entity):
+    def _prep_entity_client_env(self, entity, ssdb):
         """Retrieve all connections registered to this entity
 
         :param entity: The entity to retrieve connections from
         :type entity:  SmartSimEntity
+        :param ssdb: comma separated database addresses
+        :type ssdb: str
         :returns: Dictionary whose keys are environment variables to be set
         :rtype: dict
         """
         client_env = {}
-        addresses = self._jobs.get_db_host_addresses()
-        if addresses:
-            client_env["SSDB"] = ",".join(addresses)
+        if ssdb:
+            client_env["SSDB"] = ssdb
             if entity.incoming_entities:
                 client_env["SSKEYIN"] = ",".join(
                     [in_entity.name for in_entity in entity.incoming_entities]
@@ -465,15 +513,13 @@ class Controller:
         :type orchestrator: Orchestrator
         """
 
-        dat_file = "/".join((orchestrator.path, "smartsim_db.dat"))
+        dat_file = osp.join(orchestrator.path, "smartsim_db.dat")
         db_jobs = self._jobs.db_jobs
         orc_data = {"db": orchestrator, "db_jobs": db_jobs}
-        steps = []
-        for db_job in db_jobs.values():
-            steps.append(self._launcher.step_mapping[db_job.name])
-        orc_data["steps"] = steps
+        step_mapping = self._launcher.step_mapping
+        orc_data["steps"] = [step_mapping[db_job.name] for db_job in db_jobs.values()]
         with open(dat_file, "wb") as pickle_file:
-            pickle.dump(orc_data, pickle_file)
+            pickle.dump(orc_data, pickle_file, protocol=pickle.HIGHEST_PROTOCOL)
 
     def _orchestrator_launch_wait(self, orchestrator):
         """Wait for the orchestrator instances to run
@@ -493,24 +539,39 @@ class Controller:
             logger.info("CTRL+C interrupt to abort and cancel launch")
 
         ready = False
+        # back off exponentially up to the jm_interval between checks and
+        # start over whenever a status changes so quick launches stay quick
+        delay = ORC_LAUNCH_INTERVAL
+        last_statuses = None
         while not ready:
             try:
-                time.sleep(CONFIG.jm_interval)
+                # wakes as soon as the JobManager updates job statuses
+                self._jobs.wait_for_update(delay)
+                delay = min(delay * 2, CONFIG.jm_interval)
                 # manually trigger job update if JM not running
                 if not self._jobs.actively_monitoring:
                     self._jobs.check_jobs()
 
                 # _jobs.get_status aquires JM lock for main thread, no need for locking
                 statuses = self.get_entity_list_status(orchestrator)
-                if all([stat == STATUS_RUNNING for stat in statuses]):
+                if statuses != last_statuses:
+                    last_statuses = statuses
+                    delay = ORC_LAUNCH_INTERVAL
+
+                running = True
+                for stat in statuses:
+                    if stat in TERMINAL_STATUSES:
+                        self.stop_entity_list(orchestrator)
+                        msg = "Orchestrator failed during startup"
+                        msg += f" See {orchestrator.path} for details"
+                        raise SmartSimError(msg)
+                    if stat != STATUS_RUNNING:
+                        running = False
+
+                if running:
                     ready = True
                     # TODO remove in favor of by node status check
                     time.sleep(CONFIG.jm_interval)
-                elif any([stat in TERMINAL_STATUSES for stat in statuses]):
-                    self.stop_entity_list(orchestrator)
-                    msg = "Orchestrator failed during startup"
-                    msg += f" See {orchestrator.path} for details"
-                    raise SmartSimError(msg)
                 else:
                     logger.debug("Waiting for orchestrator instances to spin up...")
             except KeyboardInterrupt as e:
@@ -558,13 +619,17 @@ class Controller:
 
             # TODO check that each db_object is running
 
-            job_steps = zip(db_config["db_jobs"].values(), db_config["steps"])
+            db_jobs = db_config["db_jobs"].values()
+            self._jobs.add_db_jobs(db_jobs)
+
+            step_mapping = self._launcher.step_mapping
+            add_existing_task = self._launcher.task_manager.add_existing
             try:
-                for db_job, step in job_steps:
-                    self._jobs.db_jobs[db_job.ename] = db_job
-                    self._launcher.step_mapping[db_job.name] = step
-                    if step.task_id:
-                        self._launcher.task_manager.add_existing(int(step.task_id))
+                for db_job, step in zip(db_jobs, db_config["steps"]):
+                    step_mapping[db_job.name] = step
+                    task_id = step.task_id
+                    if task_id:
+                        add_existing_task(int(task_id))
             except LauncherError as e:
                 raise SmartSimError("Failed to reconnect orchestrator") from e
 
@@ -26,7 +26,8 @@
 
 import itertools
 import time
-from threading import Thread
+from threading import Condition, Thread
+from types import MappingProxyType
 
 from ..config import CONFIG
 from ..constants import LOCAL_JM_INTERVAL, TERMINAL_STATUSES
@@ -67,6 +68,15 @@ class JobManager:
         # completed jobs
         self.completed = {}
 
+        # read-only copies of the active jobs, see _publish_snapshots
+        self._snapshot = MappingProxyType({})
+        self._snapshot_db = MappingProxyType({})
+        self._jobs_changed = False
+        self._db_jobs_changed = False
+
+        # notified whenever job statuses are updated or jobs complete
+        self._update_cond = Condition()
+
         self.actively_monitoring = False  # on/off flag
         self._launcher = launcher  # reference to launcher
         self._lock = lock  # thread lock
@@ -130,10 +140,13 @@ class JobManager:
             # remove from actively monitored jobs
             if job.ename in self.db_jobs.keys():
                 del self.db_jobs[job.ename]
+                self._db_jobs_changed = True
             elif job.ename in self.jobs.keys():
                 del self.jobs[job.ename]
+                self._jobs_changed = True
         finally:
             self._lock.release()
+        self._notify_update()
 
     def __getitem__(self, entity_name):
         """Return the job associated with the name of the entity
@@ -165,6 +178,28 @@ class JobManager:
         all_jobs = {**self.jobs, **self.db_jobs}
         return all_jobs
 
+    @property
+    def snapshot(self):
+        """Read-only view of the active, non-database jobs
+
+        :returns: mapping of entity name to Job
+        :rtype: MappingProxyType
+        """
+        if self._jobs_changed:
+            self._publish_snapshots()
+        return self._snapshot
+
+    @property
+    def db_snapshot(self):
+        """Read-only view of the active database jobs
+
+        :returns: mapping of entity name to Job
+        :rtype: MappingProxyType
+        """
+        if self._db_jobs_changed:
+            self._publish_snapshots()
+        return self._snapshot_db
+
     def add_job(self, job_name, job_id, entity):
         """Add a job to the job manager which holds specific jobs by type.
 
@@ -175,12 +210,32 @@ class JobManager:
         :param entity: entity that was launched on job step
         :type entity: SmartSimEntity
         """
-        # all operations here should be atomic
         job = Job(job_name, job_id, entity)
-        if isinstance(entity, (DBNode, Orchestrator)):
-            self.db_jobs[entity.name] = job
-        else:
-            self.jobs[entity.name] = job
+        self._lock.acquire()
+        try:
+            if isinstance(entity, (DBNode, Orchestrator)):
+                self.db_jobs[entity.name] = job
+                self._db_jobs_changed = True
+            else:
+                self.jobs[entity.name] = job
+                self._jobs_changed = True
+        finally:
+            self._lock.release()
+
+    def add_db_jobs(self, db_jobs):
+        """Add existing database jobs, e.g. from a reloaded
+        orchestrator checkpoint, to be actively monitored.
+
+        :param db_jobs: database jobs to add
+        :type db_jobs: iterable of Job
+        """
+        self._lock.acquire()
+        try:
+            for db_job in db_jobs:
+                self.db_jobs[db_job.ename] = db_job
+            self._db_jobs_changed = True
+        finally:
+            self._lock.release()
 
     def is_finished(self, entity):
         """Detect if a job has completed
@@ -226,6 +281,26 @@ class JobManager:
                 )
         finally:
             self._lock.release()
+        self._notify_update()
+
+    def wait_for_update(self, timeout, predicate=None):
+        """Block until job statuses are next updated
+
+        The wait ends as soon as ``check_jobs`` refreshes the
+        job statuses or a job is moved to completed. If a predicate
+        is provided, keep waiting until it returns True instead.
+
+        :param timeout: maximum number of seconds to wait
+        :type timeout: float
+        :param predicate: callable to wait on, defaults to None
+        :type predicate: callable, optional
+        :return: False if the wait timed out
+        :rtype: bool
+        """
+        with self._update_cond:
+            if predicate:
+                return self._update_cond.wait_for(predicate, timeout)
+            return self._update_cond.wait(timeout)
 
     def get_status(self, entity):
         """Return the status of a job.
@@ -234,19 +309,36 @@ class JobManager:
         :type entity: SmartSimEntity | EntityList
         :returns: tuple of status
         """
+        return self.get_statuses([entity])[0]
+
+    def get_statuses(self, entities):
+        """Return the statuses of many jobs at once.
+
+        Statuses are read from the jobs as last updated by
+        ``check_jobs`` so the launcher is not queried and the
+        lock is only acquired once for all entities.
+
+        :param entities: SmartSimEntity or EntityList instances
+        :type entities: list[SmartSimEntity | EntityList]
+        :returns: list of statuses in the order of ``entities``
+        :rtype: list[str]
+        """
         self._lock.acquire()
         try:
-            if entity.name in self.completed:
-                return self.completed[entity.name].status
-
-            job = self[entity.name]  # locked
+            statuses = []
+            for entity in entities:
+                # finished jobs will never change status again
+                if entity.name in self.completed:
+                    statuses.append(self.completed[entity.name].status)
+                else:
+                    statuses.append(self[entity.name].status)  # locked
+            return statuses
         except KeyError:
             raise SmartSimError(
                 f"Entity by the name of {entity.name} has not been launched by this Controller"
             ) from None
         finally:
             self._lock.release()
-        return job.status
 
     def set_launcher(self, launcher):
         """Set the launcher of the job manager to a specific launcher instance
@@ -286,8 +378,10 @@ class JobManager:
             job.reset(job_name, job_id)
             if isinstance(job.entity, (DBNode, Orchestrator)):
                 self.db_jobs[entity_name] = job
+                self._db_jobs_changed = True
             else:
                 self.jobs[entity_name] = job
+                self._jobs_changed = True
         finally:
             self._lock.release()
 
@@ -321,6 +415,31 @@ class JobManager:
         finally:
             self._lock.release()
 
+    def _publish_snapshots(self):
+        """Publish read-only copies of the active jobs
+
+        Changes to ``jobs`` or ``db_jobs`` only mark that table as
+        changed. The copy is rebuilt here, under the lock, the next
+        time it is read, so a burst of changes costs a single copy.
+        The published mappings are swapped in whole and never
+        mutated, so readers can iterate them without the lock.
+        """
+        self._lock.acquire()
+        try:
+            if self._jobs_changed:
+                self._snapshot = MappingProxyType(dict(self.jobs))
+                self._jobs_changed = False
+            if self._db_jobs_changed:
+                self._snapshot_db = MappingProxyType(dict(self.db_jobs))
+                self._db_jobs_changed = False
+        finally:
+            self._lock.release()
+
+    def _notify_update(self):
+        """Wake any threads waiting on a job status update"""
+        with self._update_cond:
+            self._update_cond.notify_all()
+
     def _thread_sleep(self):
         """Sleep the job manager for a specific constant
         set for the launcher type.
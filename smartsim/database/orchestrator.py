@@ -93,6 +93,18 @@ class Orchestrator(EntityList):
             self._hosts = self._get_db_hosts()
         return self._hosts
 
+    def _assign_hosts(self, node_lists):
+        """Record the hosts each database instance was launched on
+
+        Used by the controller once the nodes of a launched
+        orchestrator have been retrieved from the launcher.
+
+        :param node_lists: hostnames of each database instance
+        :type node_lists: list[list[str]]
+        """
+        for dbnode, (host, *_) in zip(self.entities, node_lists):
+            dbnode._host = host
+
     def remove_stale_files(self):
         """Can be used to remove database files of a previous launch"""
 
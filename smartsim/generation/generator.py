@@ -26,9 +26,11 @@
 
 import pathlib
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from distutils import dir_util
 from os import mkdir, path, symlink
 
+from ..constants import MAX_WORKER_THREADS
 from ..entity import Model
 from ..error import EntityExistsError
 from ..utils import get_logger
@@ -167,6 +169,10 @@ class Generator:
     def _gen_entity_dirs(self, entities, entity_list=None):
         """Generate directories for Entity instances
 
+        Entity directories are populated concurrently. Tagged files
+        are configured afterwards, one entity at a time, as the
+        ``ModelWriter`` is shared.
+
         :param entities: list of Entity instances
         :type entities: list
         :param entity_list: EntityList instance, defaults to None
@@ -177,27 +183,52 @@ class Generator:
         if not entities:
             return
 
-        for entity in entities:
-            if entity_list:
-                dst = path.join(self.gen_path, entity_list.name, entity.name)
-            else:
-                dst = path.join(self.gen_path, entity.name)
+        if len(entities) < 2:
+            for entity in entities:
+                self._gen_entity_dir(entity, entity_list)
+        else:
+            max_workers = min(MAX_WORKER_THREADS, len(entities))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = [
+                    executor.submit(self._gen_entity_dir, entity, entity_list)
+                    for entity in entities
+                ]
+                for future in futures:
+                    future.result()
 
-            if path.isdir(dst):
-                if self.overwrite:
-                    shutil.rmtree(dst)
-                else:
-                    error = (
-                        f"Directory for entity {entity.name} "
-                        f"already exists in path {dst}"
-                    )
-                    raise FileExistsError(error)
-            pathlib.Path(dst).mkdir(exist_ok=True)
-            entity.path = dst
-            self._copy_entity_files(entity)
-            self._link_entity_files(entity)
+        for entity in entities:
             self._write_tagged_entity_files(entity)
 
+    def _gen_entity_dir(self, entity, entity_list=None):
+        """Create the directory for a single entity and populate
+           it with the copied and linked files attached to it.
+
+        :param entity: Entity instance
+        :type entity: SmartSimEntity
+        :param entity_list: EntityList instance, defaults to None
+        :type entity_list: EntityList, optional
+        :raises FileExistsError: if a directory already exists for the
+                                 entity and overwrite is False
+        """
+        if entity_list:
+            dst = path.join(self.gen_path, entity_list.name, entity.name)
+        else:
+            dst = path.join(self.gen_path, entity.name)
+
+        if path.isdir(dst):
+            if self.overwrite:
+                shutil.rmtree(dst)
+            else:
+                error = (
+                    f"Directory for entity {entity.name} "
+                    f"already exists in path {dst}"
+                )
+                raise FileExistsError(error)
+        pathlib.Path(dst).mkdir(exist_ok=True)
+        entity.path = dst
+        self._copy_entity_files(entity)
+        self._link_entity_files(entity)
+
     def _write_tagged_entity_files(self, entity):
         """Read, configure and write the tagged input files for
            a Model instance within an ensemble. This function
@@ -36,6 +36,7 @@ class ModelWriter:
     def __init__(self):
         self.tag = ";"
         self.regex = "(;.+;)"
+        self._pattern = re.compile(self.regex)
         self.lines = []
 
     def set_tag(self, tag, regex=None):
@@ -54,6 +55,7 @@ class ModelWriter:
         else:
             self.tag = tag
             self.regex = "".join(("(", tag, ".+", tag, ")"))
+        self._pattern = re.compile(self.regex)
 
     def configure_tagged_model_files(self, tagged_files, params):
         """Read, write and configure tagged files attached to a Model
@@ -89,10 +91,8 @@ class ModelWriter:
         :raises ParameterWriterError: if the newly created file cannot be read
         """
         try:
-            fp = open(file_path, "w+")
-            for line in self.lines:
-                fp.write(line)
-            fp.close()
+            with open(file_path, "w+") as fp:
+                fp.writelines(self.lines)
         except (IOError, OSError) as e:
             raise ParameterWriterError(file_path, read=False) from e
 
@@ -106,13 +106,13 @@ class ModelWriter:
         edited = []
         unused_tags = {}
         for i, line in enumerate(self.lines):
-            search = re.search(self.regex, line)
+            search = self._pattern.search(line)
             if search:
                 tagged_line = search.group(0)
                 previous_value = self._get_prev_value(tagged_line)
                 if self._is_ensemble_spec(tagged_line, params):
                     new_val = str(params[previous_value])
-                    new_line = re.sub(self.regex, new_val, line)
+                    new_line = self._pattern.sub(new_val, line)
                     edited.append(new_line)
 
                 # if a tag is found but is not in this model's configurations
@@ -122,7 +122,7 @@ class ModelWriter:
                     if tag not in unused_tags:
                         unused_tags[tag] = []
                     unused_tags[tag].append(i + 1)
-                    edited.append(re.sub(self.regex, previous_value, line))
+                    edited.append(self._pattern.sub(previous_value, line))
             else:
                 edited.append(line)
         for tag in unused_tags:
@@ -36,7 +36,11 @@ from ..launcher import WLMLauncher
 from ..pbs.pbsCommands import qdel, qstat
 from ..step import AprunStep, CobaltBatchStep, MpirunStep
 from ..stepInfo import CobaltStepInfo
-from .cobaltParser import parse_cobalt_step_id, parse_cobalt_step_status, parse_qsub_out
+from .cobaltParser import (
+    parse_cobalt_step_id,
+    parse_cobalt_step_statuses,
+    parse_qsub_out,
+)
 
 logger = get_logger(__name__)
 
@@ -178,12 +182,11 @@ class CobaltLauncher(WLMLauncher):
         args.extend(step_ids)
         qstat_out, _ = qstat(args)
 
-        stats = [
-            parse_cobalt_step_status(qstat_out, str(step_id)) for step_id in step_ids
-        ]
+        stats = parse_cobalt_step_statuses(qstat_out)
         # create CobaltStepInfo objects to return
         updates = []
-        for stat, _ in zip(stats, step_ids):
+        for step_id in step_ids:
+            stat = stats.get(str(step_id), "NOTFOUND")
             info = CobaltStepInfo(stat, None)  # returncode not logged by Cobalt
 
             if info.status == STATUS_COMPLETED:
@@ -26,13 +26,35 @@
 
 
 def parse_cobalt_step_status(output, step_id):
-    status = "NOTFOUND"
+    """Parse and return the status of a job from a cobalt qstat command
+
+    :param output: output of qstat --header JobId:State
+    :type output: str
+    :param step_id: id of the job to find
+    :type step_id: str
+    :return: status, "NOTFOUND" if the job is not listed
+    :rtype: str
+    """
+    return parse_cobalt_step_statuses(output).get(step_id, "NOTFOUND")
+
+
+def parse_cobalt_step_statuses(output):
+    """Parse and return the statuses of many jobs from a
+    single cobalt qstat command
+
+    :param output: output of qstat --header JobId:State
+    :type output: str
+    :return: mapping of job id to status
+    :rtype: dict[str, str]
+    """
+    statuses = {}
     for line in output.split("\n"):
-        if line.strip().startswith(step_id):
-            line = line.split()
-            status = line[1]
-            break
-    return status
+        line = line.split()
+        if len(line) < 2:
+            continue
+        if line[0] not in statuses:
+            statuses[line[0]] = line[1]
+    return statuses
 
 
 def parse_cobalt_step_id(output, step_name):
@@ -48,12 +48,34 @@ class Launcher(abc.ABC):
     def create_step(self, name, cwd, step_settings):
         raise NotImplementedError
 
+    def create_steps(self, step_specs):
+        """Create many job steps at once
+
+        :param step_specs: (name, cwd, step_settings) of each step
+        :type step_specs: list[tuple]
+        :return: step instances in the order of ``step_specs``
+        :rtype: list[Step]
+        """
+        create_step = self.create_step
+        return [create_step(name, cwd, settings) for name, cwd, settings in step_specs]
+
     @abc.abstractmethod
     def get_step_update(self, step_names):
         raise NotImplementedError
 
     @abc.abstractmethod
     def get_step_nodes(self, step_names):
+        """Return the compute nodes of many job steps
+
+        Implementations should retrieve the nodes of all
+        ``step_names`` with as few WLM calls as possible,
+        ideally one per call of this method.
+
+        :param step_names: list of job step names
+        :type step_names: list[str]
+        :return: list of hostnames for each step, in order
+        :rtype: list[list[str]]
+        """
         raise NotImplementedError
 
     @abc.abstractmethod
@@ -99,20 +121,22 @@ class WLMLauncher(Launcher):  # cov-wlm
         updates = []
 
         # get updates of jobs managed by workload manager (PBS, Slurm, etc)
-        # this is primarily batch jobs.
+        # this is primarily batch jobs. All ids are queried in one WLM call
+        # and each unique id is only queried once.
         s_names, step_ids = self.step_mapping.get_ids(step_names, managed=True)
         if len(step_ids) > 0:
-            s_statuses = self._get_managed_step_update(step_ids)
-            _updates = [(name, stat) for name, stat in zip(s_names, s_statuses)]
-            updates.extend(_updates)
+            unique_ids = list(dict.fromkeys(step_ids))
+            s_statuses = self._get_managed_step_update(unique_ids)
+            id_to_status = dict(zip(unique_ids, s_statuses))
+            for name, step_id in zip(s_names, step_ids):
+                updates.append((name, id_to_status[step_id]))
 
         # get updates of unmanaged jobs (Aprun, mpirun, etc)
         # usually jobs started and monitored through the Popen interface
         t_names, task_ids = self.step_mapping.get_ids(step_names, managed=False)
         if len(task_ids) > 0:
             t_statuses = self._get_unmanaged_step_update(task_ids)
-            _updates = [(name, stat) for name, stat in zip(t_names, t_statuses)]
-            updates.extend(_updates)
+            updates.extend(zip(t_names, t_statuses))
 
         return updates
 
@@ -132,4 +156,15 @@ class WLMLauncher(Launcher):  # cov-wlm
         return updates
 
     def _get_managed_step_update(self, step_ids):
-        pass
+        """Get step updates for WLM managed jobs
+
+        Implementations must query the workload manager for
+        all of ``step_ids`` with a single command rather than
+        one command per id.
+
+        :param step_ids: list of unique job step ids
+        :type step_ids: list[str]
+        :return: list of updates in the order of ``step_ids``
+        :rtype: list[StepInfo]
+        """
+        raise NotImplementedError
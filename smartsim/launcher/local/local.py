@@ -27,6 +27,7 @@
 from ...error import LauncherError
 from ...settings import RunSettings
 from ...utils import get_logger
+from ..launcher import Launcher
 from ..step import LocalStep
 from ..stepInfo import UnmanagedStepInfo
 from ..stepMapping import StepMapping
@@ -35,10 +36,11 @@ from ..taskManager import TaskManager
 logger = get_logger(__name__)
 
 
-class LocalLauncher:
+class LocalLauncher(Launcher):
     """Launcher used for spawning proceses on a localhost machine."""
 
     def __init__(self):
+        super().__init__()
         self.task_manager = TaskManager()
         self.step_mapping = StepMapping()
 
@@ -34,7 +34,7 @@ from ..launcher import WLMLauncher
 from ..step import AprunStep, MpirunStep, QsubBatchStep
 from ..stepInfo import PBSStepInfo
 from .pbsCommands import qdel, qstat
-from .pbsParser import parse_qstat_jobid, parse_step_id_from_qstat
+from .pbsParser import parse_qstat_jobids, parse_step_id_from_qstat
 
 logger = get_logger(__name__)
 
@@ -173,11 +173,11 @@ class PBSLauncher(WLMLauncher):
         updates = []
 
         qstat_out, _ = qstat(step_ids)
-        stats = [parse_qstat_jobid(qstat_out, str(step_id)) for step_id in step_ids]
+        stats = parse_qstat_jobids(qstat_out)
         # create PBSStepInfo objects to return
 
-        for stat, _ in zip(stats, step_ids):
-            info = PBSStepInfo(stat, None)
+        for step_id in step_ids:
+            info = PBSStepInfo(stats.get(str(step_id), "NOTFOUND"), None)
             # account for case where job history is not logged by PBS
             if info.status == STATUS_COMPLETED:
                 info.returncode = 0
@@ -68,17 +68,28 @@ def parse_qstat_jobid(output, job_id):
     :type output: str
     :param job_id: allocation id or job step id
     :type job_id: str
-    :return: status
+    :return: status, "NOTFOUND" if the job is not listed
     :rtype: str
     """
-    result = "NOTFOUND"
+    return parse_qstat_jobids(output).get(job_id, "NOTFOUND")
+
+
+def parse_qstat_jobids(output):
+    """Parse and return the statuses of many jobs from one qstat command
+
+    :param output: output of the qstat command
+    :type output: str
+    :return: mapping of job id to status
+    :rtype: dict[str, str]
+    """
+    results = {}
     for line in output.split("\n"):
-        if line.strip().startswith(job_id):
-            line = line.split()
-            stat = line[4]
-            result = stat
-            break
-    return result
+        line = line.split()
+        if len(line) < 5:
+            continue
+        if line[0] not in results:
+            results[line[0]] = line[4]
+    return results
 
 
 def parse_qstat_nodes(output):
@@ -26,6 +26,7 @@
 
 import time
 from shutil import which
+from threading import BoundedSemaphore
 
 from ...constants import STATUS_CANCELLED
 from ...error import LauncherError, SSConfigError, SSUnsupportedError
@@ -35,10 +36,18 @@ from ..launcher import WLMLauncher
 from ..step import MpirunStep, SbatchStep, SrunStep
 from ..stepInfo import SlurmStepInfo
 from .slurmCommands import sacct, scancel, sstat
-from .slurmParser import parse_sacct, parse_sstat_nodes, parse_step_id_from_sacct
+from .slurmParser import (
+    parse_sacct_jobs,
+    parse_sstat_step_nodes,
+    parse_step_id_from_sacct,
+)
 
 logger = get_logger(__name__)
 
+# maximum number of steps launched at once that may be looking
+# up their step id and resting in sacct, see SlurmLauncher.run
+_MAX_SACCT_LOOKUPS = 4
+
 
 class SlurmLauncher(WLMLauncher):
     """This class encapsulates the functionality needed
@@ -51,7 +60,11 @@ class SlurmLauncher(WLMLauncher):
     i.e. a psutil.Popen object
     """
 
-    # init in launcher.py (WLMLauncher)
+    def __init__(self):
+        super().__init__()
+        # steps may be launched concurrently by the controller, this
+        # paces the sacct queries made while they are launched
+        self._sacct_slots = BoundedSemaphore(_MAX_SACCT_LOOKUPS)
 
     def create_step(self, name, cwd, step_settings):
         """Create a Slurm job step
@@ -109,9 +122,7 @@ class SlurmLauncher(WLMLauncher):
             raise LauncherError("Failed to retrieve nodelist from stat")
 
         # parse node list for each step
-        node_lists = []
-        for step_id in step_ids:
-            node_lists.append(parse_sstat_nodes(output, step_id))
+        node_lists = parse_sstat_step_nodes(output, [str(sid) for sid in step_ids])
 
         if len(node_lists) < 1:
             raise LauncherError("Failed to retrieve nodelist from stat")
@@ -157,13 +168,14 @@ class SlurmLauncher(WLMLauncher):
                     cmd_list, step.cwd, out=output, err=error
                 )
 
-        if not step_id and step.managed:
-            step_id = self._get_slurm_step_id(step)
-        self.step_mapping.add(step.name, step_id, task_id, step.managed)
+        with self._sacct_slots:
+            if not step_id and step.managed:
+                step_id = self._get_slurm_step_id(step)
+            self.step_mapping.add(step.name, step_id, task_id, step.managed)
 
-        # give slurm a rest
-        # TODO make this configurable
-        time.sleep(1)
+            # give slurm a rest
+            # TODO make this configurable
+            time.sleep(1)
 
         return step_id
 
@@ -224,12 +236,13 @@ class SlurmLauncher(WLMLauncher):
         """
         step_str = _create_step_id_str(step_ids)
         sacct_out, _ = sacct(["--noheader", "-p", "-b", "--jobs", step_str])
-        # (status, returncode)
-        stat_tuples = [parse_sacct(sacct_out, step_id) for step_id in step_ids]
+        # {step_id: (status, returncode)} parsed in a single pass
+        stat_tuples = parse_sacct_jobs(sacct_out)
 
         # create SlurmStepInfo objects to return
         updates = []
-        for stat_tuple, step_id in zip(stat_tuples, step_ids):
+        for step_id in step_ids:
+            stat_tuple = stat_tuples.get(str(step_id), ("PENDING", None))
             info = SlurmStepInfo(stat_tuple[0], stat_tuple[1])
 
             task_id = self.step_mapping.get_task_id(step_id)
@@ -263,8 +276,4 @@ class SlurmLauncher(WLMLauncher):
 
 
 def _create_step_id_str(step_ids):
-    step_str = ""
-    for step_id in step_ids:
-        step_str += str(step_id) + ","
-    step_str = step_str.strip(",")
-    return step_str
+    return ",".join([str(step_id) for step_id in step_ids])
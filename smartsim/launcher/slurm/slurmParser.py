@@ -73,18 +73,30 @@ def parse_sacct(output, job_id):
     :type output: str
     :param job_id: allocation id or job step id
     :type job_id: str
-    :return: status and returncode
+    :return: status and returncode, ("PENDING", None) if not found
     :rtype: tuple
     """
-    result = ("PENDING", None)
+    return parse_sacct_jobs(output).get(job_id, ("PENDING", None))
+
+
+def parse_sacct_jobs(output):
+    """Parse and return the statuses of many jobs from one sacct command
+
+    :param output: output of the sacct command
+    :type output: str
+    :return: mapping of job id to (status, returncode)
+    :rtype: dict[str, tuple]
+    """
+    results = {}
     for line in output.split("\n"):
-        if line.strip().startswith(job_id):
-            line = line.split("|")
-            stat = line[1]
-            code = line[2].split(":")[0]
-            result = (stat, code)
-            break
-    return result
+        sacct_string = line.strip().split("|")
+        if len(sacct_string) < 3:
+            continue
+        job_id = sacct_string[0]
+        if job_id not in results:
+            code = sacct_string[2].split(":")[0]
+            results[job_id] = (sacct_string[1], code)
+    return results
 
 
 def parse_sstat_nodes(output, job_id):
@@ -95,19 +107,43 @@ def parse_sstat_nodes(output, job_id):
 
     :param output: output of the sstat command
     :type output: str
+    :param job_id: allocation id or job step id
+    :type job_id: str
     :return: compute nodes of the allocation or job
     :rtype: list of str
     """
-    nodes = []
+    return parse_sstat_step_nodes(output, [job_id])[0]
+
+
+def parse_sstat_step_nodes(output, job_ids):
+    """Parse and return the nodes of many jobs from one sstat command
+
+    Nodes of every step that starts with a job id are returned
+    for that job id with the duplicates removed.
+
+    :param output: output of the sstat command
+    :type output: str
+    :param job_ids: allocation ids or job step ids
+    :type job_ids: list[str]
+    :return: compute nodes of each job in the order of ``job_ids``
+    :rtype: list[list[str]]
+    """
+    step_nodes = {}
     for line in output.split("\n"):
         sstat_string = line.split("|")
 
         # sometimes there are \n that we need to ignore
         if len(sstat_string) >= 2:
-            if sstat_string[0].startswith(job_id):
-                node = sstat_string[1]
-                nodes.append(node)
-    return list(set(nodes))
+            step_nodes.setdefault(sstat_string[0], set()).add(sstat_string[1])
+
+    node_lists = []
+    for job_id in job_ids:
+        nodes = set()
+        for step_id, hosts in step_nodes.items():
+            if step_id.startswith(job_id):
+                nodes.update(hosts)
+        node_lists.append(list(nodes))
+    return node_lists
 
 
 def parse_step_id_from_sacct(output, step_name):
@@ -25,6 +25,7 @@
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 from collections import namedtuple
+from threading import RLock
 
 StepMap = namedtuple("StepMap", ["step_id", "task_id", "managed"])
 
@@ -33,36 +34,44 @@ class StepMapping:
     def __init__(self):
         # step_name : wlm_id, pid, wlm_managed?
         self.mapping = {}
+        # steps may be added from launch threads while the
+        # JobManager thread reads the mapping for status updates
+        self._lock = RLock()
 
     def __getitem__(self, step_name):
-        return self.mapping[step_name]
+        with self._lock:
+            return self.mapping[step_name]
 
     def __setitem__(self, step_name, step_map):
-        self.mapping[step_name] = step_map
+        with self._lock:
+            self.mapping[step_name] = step_map
 
     def add(self, step_name, step_id=None, task_id=None, managed=True):
-        self.mapping[step_name] = StepMap(step_id, task_id, managed)
+        with self._lock:
+            self.mapping[step_name] = StepMap(step_id, task_id, managed)
 
     def get_task_id(self, step_id):
         """Get the task id from the step id"""
         task_id = None
-        for stepmap in self.mapping.values():
-            if stepmap.step_id == step_id:
-                task_id = stepmap.task_id
-                break
+        with self._lock:
+            for stepmap in self.mapping.values():
+                if stepmap.step_id == step_id:
+                    task_id = stepmap.task_id
+                    break
         return task_id
 
     def get_ids(self, step_names, managed=True):
         ids = []
         names = []
-        for name in step_names:
-            if name in self.mapping:
-                stepmap = self.mapping[name]
-                # do we want task(unmanaged) or step(managed) id?
-                if managed and stepmap.managed:
-                    names.append(name)
-                    ids.append(stepmap.step_id)
-                elif not managed and not stepmap.managed:
-                    names.append(name)
-                    ids.append(stepmap.task_id)
+        with self._lock:
+            for name in step_names:
+                if name in self.mapping:
+                    stepmap = self.mapping[name]
+                    # do we want task(unmanaged) or step(managed) id?
+                    if managed and stepmap.managed:
+                        names.append(name)
+                        ids.append(stepmap.step_id)
+                    elif not managed and not stepmap.managed:
+                        names.append(name)
+                        ids.append(stepmap.task_id)
         return names, ids
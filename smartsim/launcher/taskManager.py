@@ -72,9 +72,19 @@ class TaskManager:
 
         The TaskManager is run as a daemon thread meaning
         that it will die when the main thread dies.
+
+        Only one monitoring thread is started even if multiple
+        launches call this concurrently.
         """
-        monitor = Thread(name="TaskManager", daemon=True, target=self.run)
-        monitor.start()
+        self._lock.acquire()
+        try:
+            if self.actively_monitoring:
+                return
+            self.actively_monitoring = True
+            monitor = Thread(name="TaskManager", daemon=True, target=self.run)
+            monitor.start()
+        finally:
+            self._lock.release()
 
     def run(self):
         """Start monitoring Tasks"""
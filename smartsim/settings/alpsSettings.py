@@ -100,7 +100,7 @@ class AprunSettings(RunSettings):
             host_list = [host_list.strip()]
         if not isinstance(host_list, list):
             raise TypeError("host_list argument must be a list of strings")
-        if not all([isinstance(host, str) for host in host_list]):
+        if not all(isinstance(host, str) for host in host_list):
             raise TypeError("host_list argument must be list of strings")
         self.run_args["nodelist"] = ",".join(host_list)
 
@@ -116,15 +116,16 @@ class AprunSettings(RunSettings):
 
         for opt, value in self.run_args.items():
             if opt not in restricted:
-                short_arg = bool(len(str(opt)) == 1)
+                opt = str(opt)
+                short_arg = len(opt) == 1
                 prefix = "-" if short_arg else "--"
                 if not value:
-                    args += [prefix + opt]
+                    args.append(prefix + opt)
+                elif short_arg:
+                    args.append(prefix + opt)
+                    args.append(str(value))
                 else:
-                    if short_arg:
-                        args += [prefix + opt, str(value)]
-                    else:
-                        args += ["=".join((prefix + opt, str(value)))]
+                    args.append(f"{prefix}{opt}={value}")
         return args
 
     def format_env_vars(self):
@@ -136,5 +137,5 @@ class AprunSettings(RunSettings):
         formatted = []
         if self.env_vars:
             for name, value in self.env_vars.items():
-                formatted += ["-e", name + "=" + str(value)]
+                formatted += ["-e", f"{name}={value}"]
         return formatted
@@ -97,7 +97,7 @@ class CobaltBatchSettings(BatchSettings):
             host_list = [host_list.strip()]
         if not isinstance(host_list, list):
             raise TypeError("host_list argument must be a list of strings")
-        if not all([isinstance(host, str) for host in host_list]):
+        if not all(isinstance(host, str) for host in host_list):
             raise TypeError("host_list argument must be list of strings")
         hosts = ",".join(host_list)
         self.batch_args["attrs"] = f"location={hosts}"
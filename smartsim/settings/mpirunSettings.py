@@ -26,6 +26,13 @@
 
 from .settings import RunSettings
 
+# run arguments that cannot be set through mpirun
+_RESTRICTED_ARGS = frozenset(("wdir", "wd"))
+
+# environment variables always exported to the job
+_PRESET_ENV_VARS = ("PATH", "LD_LIBRARY_PATH", "PYTHONPATH")
+_PRESET_ENV_ARGS = tuple(arg for var in _PRESET_ENV_VARS for arg in ("-x", var))
+
 
 class MpirunSettings(RunSettings):
     def __init__(self, exe, exe_args=None, run_args=None, env_vars=None):
@@ -92,7 +99,8 @@ class MpirunSettings(RunSettings):
     def set_tasks(self, num_tasks):
         """Set the number of tasks for this job
 
-        This sets ``--n``
+        This sets ``--n``. The count is stored as an int and
+        only converted to a string when the run arguments are formatted.
 
         :param num_tasks: number of tasks
         :type num_tasks: int
@@ -110,7 +118,7 @@ class MpirunSettings(RunSettings):
             host_list = [host_list.strip()]
         if not isinstance(host_list, list):
             raise TypeError("host_list argument must be a list of strings")
-        if not all([isinstance(host, str) for host in host_list]):
+        if not all(isinstance(host, str) for host in host_list):
             raise TypeError("host_list argument must be list of strings")
         self.run_args["host"] = ",".join(host_list)
 
@@ -122,12 +130,12 @@ class MpirunSettings(RunSettings):
         """
         # args launcher uses
         args = []
-        restricted = ["wdir", "wd"]
 
         for opt, value in self.run_args.items():
-            if opt not in restricted:
+            if opt not in _RESTRICTED_ARGS:
                 prefix = "--"
-                if not value:
+                # values are stored as given and only stringified here
+                if value is None:
                     args += [prefix + opt]
                 else:
                     args += [prefix + opt, str(value)]
@@ -142,15 +150,11 @@ class MpirunSettings(RunSettings):
         :return: list of env vars
         :rtype: list[str]
         """
-        formatted = []
-        presets = ["PATH", "LD_LIBRARY_PATH", "PYTHONPATH"]
-        for preset in presets:
-            formatted.extend(["-x", preset])
-
+        formatted = list(_PRESET_ENV_ARGS)
         if self.env_vars:
-            for name, value in self.env_vars.items():
-                if value:
-                    formatted += ["-x", "=".join((name, str(value)))]
-                else:
-                    formatted += ["-x", name]
+            formatted.extend(
+                arg
+                for name, value in self.env_vars.items()
+                for arg in ("-x", f"{name}={value}" if value else name)
+            )
         return formatted
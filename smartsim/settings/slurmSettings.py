@@ -28,6 +28,10 @@ import os
 
 from .settings import BatchSettings, RunSettings
 
+# environment variables always exported to the job
+# TODO make these overridable by user
+_PRESET_ENV_VARS = ("PATH", "LD_LIBRARY_PATH", "PYTHONPATH")
+
 
 class SrunSettings(RunSettings):
     def __init__(self, exe, exe_args=None, run_args=None, env_vars=None, alloc=None):
@@ -38,6 +42,9 @@ class SrunSettings(RunSettings):
         If an allocation is specified, the instance receiving these run
         parameters will launch on that allocation.
 
+        Arguments in ``run_args`` that do not take a value should be
+        given a value of None. e.g. {'exclusive': None}
+
         :param exe: executable
         :type exe: str
         :param exe_args: executable arguments
@@ -76,7 +83,7 @@ class SrunSettings(RunSettings):
             host_list = [host_list.strip()]
         if not isinstance(host_list, list):
             raise TypeError("host_list argument must be a list of strings")
-        if not all([isinstance(host, str) for host in host_list]):
+        if not all(isinstance(host, str) for host in host_list):
             raise TypeError("host_list argument must be list of strings")
         self.run_args["nodelist"] = ",".join(host_list)
 
@@ -116,19 +123,7 @@ class SrunSettings(RunSettings):
         :return: list slurm arguments for these settings
         :rtype: list[str]
         """
-        # add additional slurm arguments based on key length
-        opts = []
-        for opt, value in self.run_args.items():
-            short_arg = bool(len(str(opt)) == 1)
-            prefix = "-" if short_arg else "--"
-            if not value:
-                opts += [prefix + opt]
-            else:
-                if short_arg:
-                    opts += [prefix + opt, str(value)]
-                else:
-                    opts += ["=".join((prefix + opt, str(value)))]
-        return opts
+        return _format_slurm_opts(self.run_args)
 
     def format_env_vars(self):
         """Build environment variable string for Slurm
@@ -140,27 +135,18 @@ class SrunSettings(RunSettings):
         :returns: the formatted string of environment variables
         :rtype: str
         """
-        # TODO make these overridable by user
-        presets = ["PATH", "LD_LIBRARY_PATH", "PYTHONPATH"]
-
-        def add_env_var(var, format_str):
-            try:
-                value = os.environ[var]
-                format_str += "=".join((var, value)) + ","
-                return format_str
-            except KeyError:
-                return format_str
-
-        format_str = ""
-
         # add env var presets due to slurm weirdness
-        for preset in presets:
-            format_str = add_env_var(preset, format_str)
+        env = os.environ
+        formatted = []
+        for preset in _PRESET_ENV_VARS:
+            value = env.get(preset)
+            if value is not None:
+                formatted.append(f"{preset}={value}")
 
         # add user supplied variables
         for k, v in self.env_vars.items():
-            format_str += "=".join((k, str(v))) + ","
-        return format_str.rstrip(",")
+            formatted.append(f"{k}={v}")
+        return ",".join(formatted)
 
 
 class SbatchSettings(BatchSettings):
@@ -239,7 +225,7 @@ class SbatchSettings(BatchSettings):
             host_list = [host_list.strip()]
         if not isinstance(host_list, list):
             raise TypeError("host_list argument must be a list of strings")
-        if not all([isinstance(host, str) for host in host_list]):
+        if not all(isinstance(host, str) for host in host_list):
             raise TypeError("host_list argument must be list of strings")
         self.batch_args["nodelist"] = ",".join(host_list)
 
@@ -249,18 +235,34 @@ class SbatchSettings(BatchSettings):
         :return: batch arguments for Sbatch
         :rtype: list[str]
         """
-        opts = []
         # TODO add restricted here
-        for opt, value in self.batch_args.items():
-            # attach "-" prefix if argument is 1 character otherwise "--"
-            short_arg = bool(len(str(opt)) == 1)
-            prefix = "-" if short_arg else "--"
-
-            if not value:
-                opts += [prefix + opt]
-            else:
-                if short_arg:
-                    opts += [prefix + opt, str(value)]
-                else:
-                    opts += ["=".join((prefix + opt, str(value)))]
-        return opts
+        return _format_slurm_opts(self.batch_args)
+
+
+def _format_slurm_opts(args):
+    """Format a dictionary of slurm arguments into a list
+
+    Single character arguments are prefixed with "-" and followed
+    by their value, longer arguments are prefixed with "--" and
+    joined to their value with "=". Arguments with a value of None
+    are treated as flags and formatted without a value.
+
+    :param args: slurm arguments
+    :type args: dict[str, str]
+    :return: formatted slurm arguments
+    :rtype: list[str]
+    """
+    opts = []
+    add_opt = opts.append
+    for opt, value in args.items():
+        opt = str(opt)
+        short_arg = len(opt) == 1
+        prefix = "-" if short_arg else "--"
+        if value is None:
+            add_opt(prefix + opt)
+        elif short_arg:
+            add_opt(prefix + opt)
+            add_opt(str(value))
+        else:
+            add_opt(f"{prefix}{opt}={value}")
+    return opts
@@ -22,3 +22,23 @@ def test_parse_qsub_out():
     )
     step_id = cobaltParser.parse_qsub_out(output)
     assert step_id == "507998"
+
+
+def test_parse_step_statuses():
+    output = (
+        "JobId      State \n"
+        "=====================\n"
+        "507975     running \n"
+        "507976     queued \n"
+    )
+    statuses = cobaltParser.parse_cobalt_step_statuses(output)
+    assert statuses["507975"] == "running"
+    assert statuses["507976"] == "queued"
+
+
+def test_parse_step_status_not_found():
+    """jobs missing from qstat output are reported as not found"""
+    output = "JobId      State \n" "=====================\n" "5079750     running \n"
+    status = cobaltParser.parse_cobalt_step_status(output, "507975")
+    assert status == "NOTFOUND"
+    assert cobaltParser.parse_cobalt_step_status("", "507975") == "NOTFOUND"
@@ -1,5 +1,8 @@
+import time
+
 import pytest
 
+from smartsim.constants import MAX_WORKER_THREADS
 from smartsim.control import Controller
 from smartsim.database import Orchestrator, PBSOrchestrator
 from smartsim.entity import Ensemble, Model
@@ -77,3 +80,24 @@ def test_bad_orc_checkpoint():
     cont = Controller(launcher="local")
     with pytest.raises(FileNotFoundError):
         cont.reload_saved_db(checkpoint)
+
+
+def test_launch_steps_cancels_pending_after_failure(monkeypatch):
+    """Steps not yet launching are cancelled once a launch fails"""
+    cont = Controller(launcher="slurm")
+    started = []
+
+    def _launch_step(job_step, entity):
+        if job_step == 0:
+            raise SmartSimError("Job step 0 failed to launch")
+        started.append(job_step)
+        time.sleep(0.5)
+
+    monkeypatch.setattr(cont, "_launch_step", _launch_step)
+    steps = [(i, None) for i in range(4 * MAX_WORKER_THREADS)]
+    with pytest.raises(SmartSimError):
+        cont._launch_steps(steps)
+
+    # only steps already picked up by a worker thread were launched
+    assert 0 < len(started) <= MAX_WORKER_THREADS
+    assert steps[-1][0] not in started
@@ -1,6 +1,5 @@
 from os import path as osp
 
-import numpy as np
 import pytest
 
 from smartsim import Experiment
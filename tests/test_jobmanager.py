@@ -0,0 +1,138 @@
+import time
+from threading import RLock, Thread
+
+import pytest
+
+from smartsim.constants import STATUS_COMPLETED, STATUS_NEW
+from smartsim.control.job import Job
+from smartsim.control.jobmanager import JobManager
+from smartsim.entity import Model
+from smartsim.error import SmartSimError
+from smartsim.settings import RunSettings
+
+rs = RunSettings("python")
+
+
+def _model(name):
+    return Model(name, {}, "./", rs)
+
+
+def test_snapshot_add_and_complete():
+    jm = JobManager(RLock())
+    assert len(jm.snapshot) == 0
+
+    for i in range(3):
+        jm.add_job(f"step_{i}", str(i), _model(f"model_{i}"))
+    snapshot = jm.snapshot
+    assert sorted(snapshot) == ["model_0", "model_1", "model_2"]
+    assert len(jm.db_snapshot) == 0
+
+    jm.move_to_completed(jm["model_1"])
+    assert sorted(jm.snapshot) == ["model_0", "model_2"]
+    # published snapshots are replaced, never mutated
+    assert sorted(snapshot) == ["model_0", "model_1", "model_2"]
+
+
+def test_snapshot_is_read_only():
+    jm = JobManager(RLock())
+    jm.add_job("step", "1", _model("model"))
+    with pytest.raises(TypeError):
+        jm.snapshot["other"] = None
+
+
+def test_snapshot_reused_until_changed():
+    jm = JobManager(RLock())
+    jm.add_job("step", "1", _model("model"))
+    assert jm.snapshot is jm.snapshot
+    jm.add_job("step_2", "2", _model("model_2"))
+    assert "model_2" in jm.snapshot
+
+
+def test_add_db_jobs():
+    jm = JobManager(RLock())
+    db_jobs = [Job(f"db_step_{i}", str(i), _model(f"db_{i}")) for i in range(2)]
+    jm.add_db_jobs(db_jobs)
+    assert sorted(jm.db_snapshot) == ["db_0", "db_1"]
+    assert len(jm.snapshot) == 0
+    assert jm["db_0"] is db_jobs[0]
+
+    jm.move_to_completed(db_jobs[0])
+    assert sorted(jm.db_snapshot) == ["db_1"]
+
+
+def test_restart_job_snapshot():
+    jm = JobManager(RLock())
+    model = _model("model")
+    jm.add_job("step", "1", model)
+    jm.move_to_completed(jm["model"])
+    assert len(jm.snapshot) == 0
+
+    jm.restart_job("step_2", "2", "model")
+    assert jm.snapshot["model"].jid == "2"
+
+
+def test_get_statuses():
+    jm = JobManager(RLock())
+    models = [_model(f"model_{i}") for i in range(2)]
+    for i, model in enumerate(models):
+        jm.add_job(f"step_{i}", str(i), model)
+    jm["model_1"].set_status(STATUS_COMPLETED, "COMPLETED", 0)
+    jm.move_to_completed(jm["model_1"])
+
+    assert jm.get_statuses(models) == [STATUS_NEW, STATUS_COMPLETED]
+    assert jm.get_status(models[1]) == STATUS_COMPLETED
+
+
+def test_get_statuses_not_launched():
+    jm = JobManager(RLock())
+    with pytest.raises(SmartSimError):
+        jm.get_statuses([_model("missing")])
+
+
+class _NoUpdateLauncher:
+    """Launcher stand-in that reports no status changes"""
+
+    def get_step_update(self, step_names):
+        return []
+
+
+def _wait_in_thread(jm, timeout, **kwargs):
+    result = {}
+
+    def wait():
+        start = time.time()
+        result["notified"] = jm.wait_for_update(timeout, **kwargs)
+        result["elapsed"] = time.time() - start
+
+    thread = Thread(target=wait)
+    thread.start()
+    time.sleep(0.1)
+    return thread, result
+
+
+def test_wait_for_update_check_jobs():
+    jm = JobManager(RLock(), launcher=_NoUpdateLauncher())
+    jm.add_job("step", "1", _model("model"))
+
+    thread, result = _wait_in_thread(jm, 10)
+    jm.check_jobs()
+    thread.join()
+    assert result["notified"]
+    assert result["elapsed"] < 5
+
+
+def test_wait_for_update_move_to_completed():
+    jm = JobManager(RLock())
+    jm.add_job("step", "1", _model("model"))
+
+    predicate = lambda: len(jm.snapshot) == 0
+    thread, result = _wait_in_thread(jm, 10, predicate=predicate)
+    jm.move_to_completed(jm["model"])
+    thread.join()
+    assert result["notified"]
+    assert result["elapsed"] < 5
+
+
+def test_wait_for_update_timeout():
+    jm = JobManager(RLock())
+    assert not jm.wait_for_update(0.1)
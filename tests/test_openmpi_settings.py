@@ -30,6 +30,15 @@ def test_mpirun_args():
     assert formatted == result
 
 
+def test_mpirun_args_zero_value():
+    run_args = {"bind-to": None, "cpus-per-proc": 0}
+    settings = MpirunSettings("python", run_args=run_args)
+    settings.set_tasks(0)
+    formatted = settings.format_run_args()
+    result = ["--bind-to", "--cpus-per-proc", "0", "--n", "0"]
+    assert formatted == result
+
+
 def test_mpirun_add_mpmd():
     settings = MpirunSettings("python")
     settings_2 = MpirunSettings("python")
@@ -41,3 +41,27 @@ def test_parse_qstat_status():
     status = "R"
     parsed_status = pbsParser.parse_qstat_jobid(output, "1289903.sdb")
     assert status == parsed_status
+
+
+def test_parse_qstat_statuses():
+    """test retrieval of many statuses from one qstat call"""
+    output = (
+        "Job id            Name             User              Time Use S Queue\n"
+        "----------------  ---------------- ----------------  -------- - -----\n"
+        "1289903.sdb       jobname          username          00:00:00 R queue\n"
+        "1289904.sdb       jobname          username          00:00:00 Q queue\n"
+    )
+    parsed = pbsParser.parse_qstat_jobids(output)
+    assert parsed["1289903.sdb"] == "R"
+    assert parsed["1289904.sdb"] == "Q"
+
+
+def test_parse_qstat_status_not_found():
+    """jobs missing from qstat output are reported as not found"""
+    output = (
+        "Job id            Name             User              Time Use S Queue\n"
+        "----------------  ---------------- ----------------  -------- - -----\n"
+        "12899030.sdb      jobname          username          00:00:00 R queue\n"
+    )
+    assert pbsParser.parse_qstat_jobid(output, "1289903.sdb") == "NOTFOUND"
+    assert pbsParser.parse_qstat_jobid("", "1289903.sdb") == "NOTFOUND"
@@ -210,3 +210,47 @@ def test_parse_sacct_status_1():
     status = ("FAILED", "1")
     parsed_status = slurmParser.parse_sacct(output, "22999.0")
     assert status == parsed_status
+
+
+def test_parse_sacct_jobs():
+    """test retrieval of many statuses from one sacct call"""
+    output = (
+        "29917893|RUNNING|0:0|\n"
+        "29917893.batch|RUNNING|0:0|\n"
+        "29917893.0|COMPLETED|0:0|\n"
+        "29917893.1|FAILED|1:0|\n"
+    )
+    parsed = slurmParser.parse_sacct_jobs(output)
+    assert parsed["29917893"] == ("RUNNING", "0")
+    assert parsed["29917893.0"] == ("COMPLETED", "0")
+    assert parsed["29917893.1"] == ("FAILED", "1")
+    assert "29917893.2" not in parsed
+
+
+def test_parse_sacct_status_exact_id():
+    """a step id must match exactly, not as a prefix of another id"""
+    output = "29917893.10|COMPLETED|0:0|\n" "29917893.1|FAILED|1:0|\n"
+    parsed_status = slurmParser.parse_sacct(output, "29917893.1")
+    assert parsed_status == ("FAILED", "1")
+
+
+def test_parse_sacct_status_not_found():
+    """jobs not yet listed by sacct are reported as pending"""
+    output = "29917893.0|COMPLETED|0:0|\n"
+    parsed_status = slurmParser.parse_sacct(output, "29917893.1")
+    assert parsed_status == ("PENDING", None)
+    assert slurmParser.parse_sacct("", "29917893.1") == ("PENDING", None)
+
+
+def test_parse_sstat_step_nodes():
+    """Parse nodes of many steps from one sstat call"""
+    output = (
+        "29917893.extern|nid00034|44860|\n"
+        "29917893.0|nid00034|44887|\n"
+        "29917893.1|nid00035|45174|\n"
+        "29917893.2|nid00036|45175|\n"
+    )
+    parsed_nodes = slurmParser.parse_sstat_step_nodes(
+        output, ["29917893.1", "29917893.2"]
+    )
+    assert parsed_nodes == [["nid00035"], ["nid00036"]]
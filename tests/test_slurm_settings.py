@@ -38,6 +38,14 @@ def test_srun_args():
     assert formatted == result
 
 
+def test_srun_args_zero_value():
+    run_args = {"exclusive": None, "c": 0, "ntasks": 0}
+    settings = SrunSettings("python", run_args=run_args)
+    formatted = settings.format_run_args()
+    result = ["--exclusive", "-c", "0", "--ntasks=0"]
+    assert formatted == result
+
+
 def test_update_env():
     env_vars = {"OMP_NUM_THREADS": 20, "LOGGING": "verbose"}
     settings = SrunSettings("python", env_vars=env_vars)
@@ -0,0 +1,29 @@
+from threading import Thread
+
+from smartsim.launcher.stepMapping import StepMapping
+
+
+def test_concurrent_add_and_lookup():
+    """Steps can be added while task ids are looked up from another thread"""
+    mapping = StepMapping()
+    errors = []
+
+    def add_steps():
+        for i in range(20000):
+            mapping.add(f"step_{i}", step_id=str(i), task_id=i)
+
+    def lookup_steps():
+        try:
+            for _ in range(2000):
+                mapping.get_task_id("missing")
+        except RuntimeError as e:
+            errors.append(e)
+
+    threads = [Thread(target=add_steps), Thread(target=lookup_steps)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert not errors
+    assert mapping.get_task_id("19999") == 19999
@@ -21,19 +21,15 @@ def collect_db_hosts(num_hosts):
        openmpi. (not needed for aprun(ALPS), Slurm, etc.
     """
 
-    hosts = []
     if "PBS_NODEFILE" in os.environ:
         node_file = os.environ["PBS_NODEFILE"]
+        # account for mpiprocs causing repeats in PBS_NODEFILE
+        # while keeping the allocation order of the hosts
         with open(node_file, "r") as f:
-            for line in f.readlines():
-                host = line.split(".")[0]
-                hosts.append(host)
+            hosts = list(dict.fromkeys(line.partition(".")[0].strip() for line in f))
     else:
         raise Exception("could not parse interactive allocation nodes from PBS_NODEFILE")
 
-    # account for mpiprocs causing repeats in PBS_NODEFILE
-    hosts = list(set(hosts))
-
     if len(hosts) >= num_hosts:
         return hosts[:num_hosts]
     else: